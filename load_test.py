@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+영어 단어 시험 프로그램 - 부하 테스트 도구
+실제 API 할당량을 쓰지 않고 OpenAI 호환 모의 서버로 채점 경로의 지연/처리량/오류율을 측정합니다.
+
+사용 예:
+    python load_test.py --sessions 200 --concurrency 20 --latency lognormal:-1.5,0.5 --rate-429 0.05
+    python load_test.py --mock-only --port 8800   # 모의 서버만 실행 (OPENAI_BASE_URL=http://127.0.0.1:8800/v1)
+"""
+import os
+import json
+import math
+import time
+import random
+import asyncio
+import argparse
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from main import OpenAIService, RemoteGradingService, WordPair, WordSampler, logger
+
+class LatencyDistribution:
+    """'fixed:0.2', 'uniform:0.1,0.5', 'exp:0.3', 'lognormal:-1.5,0.5' 형식의 지연 분포"""
+
+    # 종류별 매개변수 이름 (개수 확인과 오류 메시지에 사용)
+    KINDS = {
+        'fixed': ('SECONDS',),
+        'uniform': ('MIN', 'MAX'),
+        'exp': ('MEAN',),
+        'lognormal': ('MU', 'SIGMA'),
+    }
+
+    def __init__(self, spec: str, rng: random.Random):
+        kind, _, params = spec.partition(':')
+        self.kind = kind.strip().lower()
+        self._rng = rng
+        if self.kind not in self.KINDS:
+            raise ValueError(f"지원하지 않는 지연 분포입니다: {spec} (가능: {', '.join(self.KINDS)})")
+        names = self.KINDS[self.kind]
+        usage = f"{self.kind}:{','.join(names)}"
+        try:
+            self.params = [float(p) for p in params.split(',')] if params.strip() else []
+        except ValueError:
+            raise ValueError(f"지연 분포 매개변수는 숫자여야 합니다: {spec} (형식: {usage})")
+        if len(self.params) != len(names) or not all(math.isfinite(p) for p in self.params):
+            raise ValueError(f"지연 분포 매개변수가 올바르지 않습니다: {spec} (형식: {usage})")
+        self._check_range(spec)
+
+    def _check_range(self, spec: str):
+        """지연 시간이 음수가 되거나 계산할 수 없는 매개변수를 거부합니다."""
+        if self.kind == 'fixed' and self.params[0] < 0:
+            raise ValueError(f"지연 시간은 0 이상이어야 합니다: {spec}")
+        if self.kind == 'uniform' and not 0 <= self.params[0] <= self.params[1]:
+            raise ValueError(f"uniform은 0 <= MIN <= MAX 여야 합니다: {spec}")
+        if self.kind == 'exp' and self.params[0] <= 0:
+            raise ValueError(f"exp의 평균은 0보다 커야 합니다: {spec}")
+        if self.kind == 'lognormal' and self.params[1] < 0:
+            raise ValueError(f"lognormal의 SIGMA는 0 이상이어야 합니다: {spec}")
+
+    def sample(self) -> float:
+        """지연 시간(초)을 하나 뽑습니다."""
+        if self.kind == 'fixed':
+            return self.params[0]
+        if self.kind == 'uniform':
+            return self._rng.uniform(self.params[0], self.params[1])
+        if self.kind == 'exp':
+            return self._rng.expovariate(1.0 / self.params[0])
+        return self._rng.lognormvariate(self.params[0], self.params[1])
+
+class MockOpenAIServer:
+    """/v1/chat/completions 만 흉내 내는 OpenAI 호환 모의 서버
+
+    프롬프트의 채점 표를 읽어 '내 답'이 정답과 같으면 O, 아니면 X로 채점한 표를 돌려주며,
+    설정한 비율로 429/500 오류와 잘린 응답(finish_reason=length)을 섞습니다.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: str = "fixed:0",
+                 rate_429: float = 0.0, rate_500: float = 0.0, truncate_rate: float = 0.0,
+                 seed: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self._rng = random.Random(seed)
+        self.latency = LatencyDistribution(latency, self._rng)
+        self.rate_429 = rate_429
+        self.rate_500 = rate_500
+        self.truncate_rate = truncate_rate
+        self.stats: Dict[str, int] = {"requests": 0, "429": 0, "500": 0, "truncated": 0}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._ready = threading.Event()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    def start(self):
+        """별도 스레드의 이벤트 루프에서 서버를 시작하고, 준비될 때까지 기다립니다."""
+        thread = threading.Thread(target=self._run_loop, name="mock-openai", daemon=True)
+        thread.start()
+        self._ready.wait()
+        logger.info(f"모의 OpenAI 서버 시작: {self.base_url}")
+
+    def stop(self):
+        """열린 연결을 정리하고 서버를 멈춥니다."""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    async def _shutdown(self):
+        self._server.close()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def serve_forever(self):
+        """현재 스레드에서 서버를 실행합니다 (Ctrl+C로 종료)."""
+        self.start()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            self.stop()
+
+    def _run_loop(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle_connection, self.host, self.port))
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _handle_connection(self, reader, writer):
+        """keep-alive 연결에서 요청을 반복해서 처리합니다."""
+        try:
+            while True:
+                request_line = (await reader.readline()).decode("latin-1").strip()
+                if not request_line:
+                    break
+                method, path = request_line.split()[:2]
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode("latin-1").strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload, extra = await self._respond(method, path, body)
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                head = (f"HTTP/1.1 {status} {self._reason(status)}\r\n"
+                        f"Content-Type: application/json\r\n"
+                        f"Content-Length: {len(data)}\r\n")
+                for name, value in extra.items():
+                    head += f"{name}: {value}\r\n"
+                writer.write(head.encode("ascii") + b"\r\n" + data)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            # 클라이언트가 연결을 끊었거나 서버 종료로 취소된 경우
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, method: str, path: str, body: bytes):
+        if method != "POST" or not path.rstrip('/').endswith("/chat/completions"):
+            return 404, {"error": {"message": f"{method} {path} not found"}}, {}
+
+        self.stats["requests"] += 1
+        await asyncio.sleep(self.latency.sample())
+
+        roll = self._rng.random()
+        if roll < self.rate_429:
+            self.stats["429"] += 1
+            return 429, {"error": {"message": "Rate limit reached (mock)", "type": "rate_limit_error"}}, \
+                {"Retry-After": "0"}
+        if roll < self.rate_429 + self.rate_500:
+            self.stats["500"] += 1
+            return 500, {"error": {"message": "Internal server error (mock)", "type": "server_error"}}, {}
+
+        request = json.loads(body.decode("utf-8"))
+        prompt = request["messages"][-1]["content"]
+        content = self._grade_prompt(prompt)
+        finish_reason = "stop"
+        if self._rng.random() < self.truncate_rate:
+            self.stats["truncated"] += 1
+            content = content[:len(content) // 2]
+            finish_reason = "length"
+
+        return 200, {
+            "id": f"chatcmpl-mock-{self.stats['requests']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "mock"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": finish_reason,
+            }],
+            "usage": {"prompt_tokens": len(prompt), "completion_tokens": len(content),
+                      "total_tokens": len(prompt) + len(content)},
+        }, {}
+
+    @staticmethod
+    def _grade_prompt(prompt: str) -> str:
+        """프롬프트의 '| 번호 | 영어 | 정답 | 내 답 |' 표에 채점 열을 붙입니다."""
+        table = "| 번호 | 영어 | 정답 | 내 답 | 채점 |\n|---|---|---|---|---|\n"
+        for line in prompt.split('\n'):
+            cells = [c.strip() for c in line.strip().split('|')[1:-1]]
+            if len(cells) != 4 or not cells[0].isdigit():
+                continue
+            grade = "O" if cells[3] and cells[3] == cells[2] else "X"
+            table += f"| {' | '.join(cells)} | {grade} |\n"
+        return table
+
+    @staticmethod
+    def _reason(status: int) -> str:
+        return {200: "OK", 404: "Not Found", 429: "Too Many Requests",
+                500: "Internal Server Error"}.get(status, "Error")
+
+@dataclass
+class SessionResult:
+    """시뮬레이션 세션 하나의 측정값 (실패한 세션은 grade_latency가 None)"""
+    latency: float
+    grade_latency: Optional[float] = None
+    error: Optional[str] = None
+    score: int = 0
+    graded: int = 0
+
+@dataclass
+class LoadTestReport:
+    """부하 테스트 결과 요약"""
+    results: List[SessionResult]
+    elapsed: float
+    server_stats: Dict[str, int] = field(default_factory=dict)
+
+    @staticmethod
+    def percentile(values: List[float], pct: float) -> float:
+        """최근접 순위(nearest-rank) 백분위수를 계산합니다."""
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def to_text(self) -> str:
+        """사람이 읽을 수 있는 보고서를 만듭니다."""
+        total = len(self.results)
+        errors: Dict[str, int] = {}
+        for result in self.results:
+            if result.error:
+                errors[result.error] = errors.get(result.error, 0) + 1
+        ok = [r for r in self.results if not r.error]
+
+        lines = [
+            "# 부하 테스트 결과",
+            "",
+            f"세션 수: {total} (성공 {len(ok)}, 실패 {total - len(ok)})",
+            f"소요 시간: {self.elapsed:.2f}초",
+            f"처리량: {total / self.elapsed if self.elapsed else 0:.2f} 세션/초",
+            f"오류율: {(total - len(ok)) / total * 100 if total else 0:.1f}%",
+            "",
+            "| 구간 | p50 | p95 | p99 | 최대 |",
+            "|---|---|---|---|---|",
+        ]
+        # 빠르게 실패한 요청(예: 429)이 섞이면 지연이 좋아 보이므로 성공/실패를 나눠 계산합니다.
+        failed = [r for r in self.results if r.error]
+        rows = [("세션 전체 (성공)", [r.latency for r in ok]),
+                ("채점 호출 (성공)", [r.grade_latency for r in ok])]
+        if failed:
+            rows.append(("실패 세션", [r.latency for r in failed]))
+        for name, values in rows:
+            lines.append(f"| {name} | {self.percentile(values, 50):.3f}s | "
+                         f"{self.percentile(values, 95):.3f}s | {self.percentile(values, 99):.3f}s | "
+                         f"{max(values) if values else 0:.3f}s |")
+
+        graded = sum(r.graded for r in ok)
+        if graded:
+            lines.append("")
+            lines.append(f"평균 점수: {sum(r.score for r in ok) / graded * 100:.1f}% (채점된 문항 {graded}개)")
+        if errors:
+            lines.append("")
+            lines.append("## 오류 유형")
+            for name, count in sorted(errors.items(), key=lambda item: -item[1]):
+                lines.append(f"- {name}: {count}")
+        if self.server_stats:
+            lines.append("")
+            lines.append("## 모의 서버 통계")
+            for name, count in self.server_stats.items():
+                lines.append(f"- {name}: {count}")
+        return "\n".join(lines)
+
+class LoadTester:
+    """파싱 -> 답안 작성 -> 채점 -> 점수 계산 세션을 동시에 여러 개 실행합니다."""
+
+    def __init__(self, service: OpenAIService, deck_paths: List[str], words_per_session: int = 20,
+                 correct_rate: float = 0.7, seed: Optional[int] = None):
+        self.service = service
+        self.deck_paths = deck_paths
+        self.words_per_session = words_per_session
+        self.correct_rate = correct_rate
+        self.seed = seed
+
+    def run(self, sessions: int, concurrency: int) -> LoadTestReport:
+        """세션들을 concurrency개 스레드로 실행하고 결과를 모읍니다."""
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(self._run_session, range(sessions)))
+        return LoadTestReport(results, time.perf_counter() - start)
+
+    def _run_session(self, index: int) -> SessionResult:
+        session_seed = None if self.seed is None else self.seed + index
+        rng = random.Random(session_seed)
+        start = time.perf_counter()
+        try:
+            # 1. 파싱 (세션마다 단어장을 새로 스트리밍)
+            words = WordSampler(self.words_per_session, seed=session_seed).sample(self.deck_paths)
+            # 2. 답안 작성
+            answers = [self._simulate_answer(word, rng) for word in words]
+            # 3. 채점
+            grade_start = time.perf_counter()
+            result = self.service.request_grading(words, answers)
+            grade_latency = time.perf_counter() - grade_start
+            # 4. 점수 계산
+            grades = OpenAIService.parse_grades(result, len(words))
+            return SessionResult(
+                latency=time.perf_counter() - start,
+                grade_latency=grade_latency,
+                score=grades.count("O"),
+                graded=sum(1 for grade in grades if grade in ("O", "X")),
+            )
+        except Exception as e:
+            return SessionResult(latency=time.perf_counter() - start, error=type(e).__name__)
+
+    def _simulate_answer(self, word: WordPair, rng: random.Random) -> str:
+        roll = rng.random()
+        if roll < self.correct_rate:
+            return word.kor
+        if roll < self.correct_rate + (1 - self.correct_rate) / 2:
+            return ""
+        return "모르겠음"
+
+def _latency_spec(value: str) -> str:
+    """지연 분포 형식을 미리 확인하는 argparse 타입입니다."""
+    try:
+        LatencyDistribution(value, random.Random())
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return value
+
+def _rate(value: str) -> float:
+    """0 이상 1 이하의 비율만 허용하는 argparse 타입입니다."""
+    try:
+        rate = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"숫자가 아닙니다: {value}")
+    if not 0.0 <= rate <= 1.0:
+        raise argparse.ArgumentTypeError(f"0과 1 사이여야 합니다: {value}")
+    return rate
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="채점 경로 부하 테스트 (OpenAI 호환 모의 서버 사용)")
+    parser.add_argument("decks", nargs="*", default=[str(Path(__file__).parent / "words" / "250716.md")],
+                        help="세션마다 단어를 뽑을 단어장 파일들")
+    parser.add_argument("--sessions", type=int, default=100, help="실행할 세션 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시에 실행할 세션 수")
+    parser.add_argument("--words", type=int, default=20, help="세션당 문제 수")
+    parser.add_argument("--correct-rate", type=_rate, default=0.7, help="시뮬레이션 학생의 정답 비율")
+    parser.add_argument("--seed", type=int, help="재현 가능한 실행을 위한 시드")
+    parser.add_argument("--retries", type=int, default=2, help="OpenAI 클라이언트 재시도 횟수")
+    parser.add_argument("--latency", type=_latency_spec, default="lognormal:-1.5,0.5",
+                        help="모의 서버 지연 분포 (fixed:S, uniform:A,B, exp:MEAN, lognormal:MU,SIGMA)")
+    parser.add_argument("--rate-429", type=_rate, default=0.0, help="429 응답 비율")
+    parser.add_argument("--rate-500", type=_rate, default=0.0, help="500 응답 비율")
+    parser.add_argument("--truncate", type=_rate, default=0.0, help="잘린 응답(finish_reason=length) 비율")
+    parser.add_argument("--port", type=int, default=0, help="모의 서버 포트 (0이면 자동 선택)")
+    parser.add_argument("--mock-only", action="store_true",
+                        help="부하 테스트 없이 모의 서버만 실행합니다")
+    parser.add_argument("--grading-server", metavar="URL",
+                        help="OpenAIService 대신 채점 서버(main.py --serve)를 통해 채점합니다")
+    args = parser.parse_args(argv)
+    if args.rate_429 + args.rate_500 > 1.0:
+        parser.error("--rate-429와 --rate-500의 합은 1 이하여야 합니다")
+    return args
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    # main.py의 로그 파일은 건드리지 않고, 세션/요청마다 남는 INFO 로그(HTTP 클라이언트 포함)가
+    # 측정 결과를 가리지 않도록 WARNING 이상만 콘솔에 남깁니다.
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    mock = MockOpenAIServer(port=args.port, latency=args.latency, rate_429=args.rate_429,
+                            rate_500=args.rate_500, truncate_rate=args.truncate, seed=args.seed)
+    if args.mock_only:
+        mock.serve_forever()
+        return
+
+    if args.grading_server:
+        # 채점 서버 쪽 OPENAI_BASE_URL을 모의 서버로 지정해 두어야 합니다.
+        service: OpenAIService = RemoteGradingService(args.grading_server)
+    else:
+        mock.start()
+        os.environ.setdefault('OPENAI_API_KEY', 'mock-key')
+        service = OpenAIService(base_url=mock.base_url, max_retries=args.retries)
+
+    tester = LoadTester(service, args.decks, words_per_session=args.words,
+                        correct_rate=args.correct_rate, seed=args.seed)
+    report = tester.run(args.sessions, args.concurrency)
+    if not args.grading_server:
+        report.server_stats = dict(mock.stats)
+        mock.stop()
+    print(report.to_text())
+
+if __name__ == "__main__":
+    main()
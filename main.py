@@ -4,15 +4,33 @@
 드래그 앤 드롭으로 마크다운 파일을 가져와서 시험을 진행합니다.
 """
 import os
+import json
+import math
+import time
+import heapq
 import random
+import asyncio
+import hashlib
+import hmac
+import ipaddress
+import argparse
+import functools
 import datetime
 import logging
+import queue
+import threading
+import uuid
+import urllib.error
+import urllib.request
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import messagebox, ttk
 from pathlib import Path
-from typing import List, Dict, Optional
-from dataclasses import dataclass
-from openai import OpenAI
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from openai import OpenAI, APIConnectionError, APIStatusError
 
 # 환경 변수 로딩
 try:
@@ -23,37 +41,123 @@ except ImportError:
 
 # 스크립트 디렉토리 설정 (어디서 실행하든 정상 작동하도록)
 SCRIPT_DIR = Path(__file__).parent.absolute()
-os.chdir(SCRIPT_DIR)
 
-# 로깅 설정
-log_file = SCRIPT_DIR / 'word_test.log'
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
-@dataclass
+def setup_app_environment():
+    """작업 디렉토리와 로깅을 설정합니다.
+    
+    다른 스크립트(load_test.py 등)에서 import할 때 작업 디렉토리나 로그 파일이
+    바뀌지 않도록 main()에서만 호출합니다.
+    """
+    os.chdir(SCRIPT_DIR)
+    
+    # 로깅 설정
+    log_file = SCRIPT_DIR / 'word_test.log'
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
+# 저장된 시험 결과 폴더 (오답률 가중 샘플링에 사용)
+RESULTS_DIR = SCRIPT_DIR / 'results'
+# 채점 실패 작업 대기열 폴더
+QUEUE_DIR = SCRIPT_DIR / 'grading_queue'
+
 class WordPair:
-    """영어 단어와 한국어 의미를 저장하는 데이터 클래스"""
-    eng: str
-    kor: str
+    """영어 단어와 한국어 의미를 저장하는 클래스
+    
+    대용량 단어장에서도 메모리를 적게 쓰도록 인스턴스마다 __dict__를 만들지 않는
+    __slots__를 사용합니다.
+    """
+    __slots__ = ('eng', 'kor')
     
-    def __post_init__(self):
-        self.eng = self.eng.strip()
-        self.kor = self.kor.strip()
+    def __init__(self, eng: str, kor: str):
+        self.eng = eng.strip()
+        self.kor = kor.strip()
+    
+    def __eq__(self, other):
+        if not isinstance(other, WordPair):
+            return NotImplemented
+        return self.eng == other.eng and self.kor == other.kor
+    
+    def __hash__(self):
+        return hash((self.eng, self.kor))
+    
+    def __repr__(self):
+        return f"WordPair(eng={self.eng!r}, kor={self.kor!r})"
+
+class WordDeck(Sequence[WordPair]):
+    """단어장 전체를 병렬 배열로 보관하는 읽기 전용 시퀀스
+    
+    모든 영어/뜻 문자열을 UTF-8 바이트 하나(_blob)에 이어 붙이고, 각 문자열의
+    시작 위치만 array('I')에 저장합니다. 단어마다 객체 3개(WordPair와 str 2개)를
+    만드는 대신 단어당 수십 바이트만 쓰며, WordPair는 꺼낼 때 만듭니다.
+    shuffle()은 바이트를 옮기지 않고 출제 순서(_order)만 섞습니다.
+    """
+    
+    def __init__(self, words: Iterable[WordPair] = ()):
+        self._blob = bytearray()
+        self._offsets = array('I', [0])  # i번째 단어: 영어 [2i, 2i+1), 뜻 [2i+1, 2i+2)
+        self._order = array('I')
+        self.extend(words)
+    
+    def append(self, word: WordPair):
+        """단어 하나를 맨 뒤에 추가합니다."""
+        self._order.append(len(self._offsets) // 2)
+        for text in (word.eng, word.kor):
+            self._blob += text.encode('utf-8')
+            self._offsets.append(len(self._blob))
+    
+    def extend(self, words: Iterable[WordPair]):
+        """여러 단어를 맨 뒤에 추가합니다."""
+        for word in words:
+            self.append(word)
+    
+    def shuffle(self, rng: random.Random):
+        """출제 순서를 섞습니다 (같은 시드면 list를 섞을 때와 같은 순서)."""
+        rng.shuffle(self._order)
+    
+    def __len__(self) -> int:
+        return len(self._order)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._word_at(i) for i in self._order[index]]
+        return self._word_at(self._order[index])
+    
+    def _word_at(self, slot: int) -> WordPair:
+        offsets, blob = self._offsets, self._blob
+        eng = blob[offsets[2 * slot]:offsets[2 * slot + 1]].decode('utf-8')
+        kor = blob[offsets[2 * slot + 1]:offsets[2 * slot + 2]].decode('utf-8')
+        return WordPair(eng, kor)
+    
+    def __repr__(self):
+        return f"WordDeck({len(self)} words)"
 
 @dataclass
 class TestResult:
-    """시험 결과를 저장하는 데이터 클래스"""
-    words: List[WordPair]
-    user_answers: Dict[str, str]
+    """시험 결과를 저장하는 데이터 클래스
+    
+    user_answers와 grades는 words와 같은 순서(문제 번호 순)의 리스트입니다.
+    """
+    words: Sequence[WordPair]
+    user_answers: List[str]
     gpt_result: str
     date_str: str
+    grades: List[str] = field(default_factory=list)
+    
+    def to_markdown(self, when: Optional[datetime.datetime] = None) -> str:
+        """저장/복사용 마크다운 문서를 생성합니다."""
+        when = when or datetime.datetime.now()
+        header = f"# 영어 단어 시험 결과\n\n"
+        header += f"시험 일시: {when.strftime('%Y-%m-%d %H:%M:%S')}\n"
+        header += f"총 문제 수: {len(self.words)}문제\n\n"
+        return header + self.gpt_result
 
 class MarkdownParser:
     """마크다운 파일에서 단어를 추출하는 클래스"""
@@ -61,7 +165,7 @@ class MarkdownParser:
     HEADER_KEYWORDS = ['word', 'english', '영어', 'vocabulary', '단어', 'meaning', '뜻']
     
     @classmethod
-    def parse_words_from_file(cls, file_path: str) -> List[WordPair]:
+    def parse_words_from_file(cls, file_path: str) -> WordDeck:
         """마크다운 파일에서 단어 목록을 추출합니다."""
         try:
             with open(file_path, "r", encoding="utf-8") as f:
@@ -73,19 +177,33 @@ class MarkdownParser:
             
         except Exception as e:
             logger.error(f"마크다운 파싱 중 오류 발생: {e}")
-            return []
+            return WordDeck()
+    
+    @classmethod
+    def iter_words_from_file(cls, file_path: str) -> Iterator[WordPair]:
+        """파일 전체를 메모리에 올리지 않고 한 줄씩 읽으며 단어를 생성합니다."""
+        with open(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith('|') and '---' not in line:
+                    yield from cls._parse_table_row(line)
+    
+    @classmethod
+    def parse_words_from_content(cls, content: str) -> WordDeck:
+        """마크다운 문자열에서 단어 목록을 추출합니다."""
+        return cls._extract_words_from_content(content)
     
     @classmethod
-    def _extract_words_from_content(cls, content: str) -> List[WordPair]:
+    def _extract_words_from_content(cls, content: str) -> WordDeck:
         """마크다운 내용에서 단어를 추출합니다."""
         lines = content.split('\n')
         table_lines = cls._extract_table_lines(lines)
         
         if not table_lines:
             logger.warning("마크다운 파일에서 테이블을 찾을 수 없습니다.")
-            return []
+            return WordDeck()
         
-        words = []
+        words = WordDeck()
         for line in table_lines:
             words.extend(cls._parse_table_row(line))
         
@@ -138,11 +256,201 @@ class MarkdownParser:
         
         return True
 
+class WordSampler:
+    """대용량 단어장에서 일부 단어만 뽑는 스트리밍 샘플러
+    
+    단어장 파일을 한 줄씩 읽으면서 가중 저수지 샘플링(Efraimidis-Spirakis)으로
+    N개만 유지하므로, 메모리 사용량은 단어장 크기가 아닌 N에 비례합니다.
+    """
+    
+    # 과거 오답률 1.0인 단어는 처음 보는 단어보다 (1 + ERROR_WEIGHT)배 자주 뽑힙니다.
+    ERROR_WEIGHT = 3.0
+    
+    def __init__(self, sample_size: int, seed: Optional[int] = None,
+                 error_rates: Optional[Dict[str, float]] = None):
+        self.sample_size = sample_size
+        self.error_rates = error_rates or {}
+        self._rng = random.Random(seed)
+    
+    def sample(self, file_paths: Sequence[str]) -> List[WordPair]:
+        """여러 단어장 파일을 스트리밍하며 단어를 샘플링합니다."""
+        if self.sample_size <= 0:
+            return []
+        
+        heap = []  # (key, 순번, 단어) 최소 힙: 가장 작은 key가 먼저 밀려남
+        seen = 0
+        for file_path in file_paths:
+            try:
+                for word in MarkdownParser.iter_words_from_file(file_path):
+                    key = self._key(word)
+                    entry = (key, seen, word)
+                    seen += 1
+                    if len(heap) < self.sample_size:
+                        heapq.heappush(heap, entry)
+                    elif key > heap[0][0]:
+                        heapq.heapreplace(heap, entry)
+            except Exception as e:
+                logger.error(f"단어장 스트리밍 중 오류 발생 ({file_path}): {e}")
+        
+        # 저수지에 남은 순서는 파일 순서에 치우쳐 있으므로 다시 섞습니다.
+        words = [word for _, _, word in heap]
+        self._rng.shuffle(words)
+        logger.info(f"샘플링 완료: 전체 {seen}개 중 {len(words)}개 선택")
+        return words
+    
+    def _key(self, word: WordPair) -> float:
+        """가중치 w에 대해 log(u)/w 를 key로 사용합니다 (u^(1/w)와 같은 순서)."""
+        weight = 1.0 + self.ERROR_WEIGHT * self.error_rates.get(word.eng, 0.0)
+        u = 1.0 - self._rng.random()  # (0, 1]
+        return math.log(u) / weight
+    
+    @staticmethod
+    def load_error_rates(results_dir: Path) -> Dict[str, float]:
+        """저장된 결과 파일(.md)들에서 단어별 오답률을 계산합니다."""
+        stats = WordSampler.load_item_stats(results_dir)
+        return {eng: wrong / total for eng, (wrong, total) in stats.items()}
+    
+    @staticmethod
+    def load_item_stats(results_dir: Path) -> Dict[str, Tuple[int, int]]:
+        """저장된 결과 파일(.md)들에서 단어별 (오답 수, 채점 수)를 집계합니다."""
+        wrong: Dict[str, int] = {}
+        total: Dict[str, int] = {}
+        if not results_dir.is_dir():
+            return {}
+        
+        for result_file in results_dir.glob("*.md"):
+            try:
+                with open(result_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        cells = [c.strip() for c in line.strip().split('|')[1:-1]]
+                        if len(cells) < 5 or not cells[0].isdigit():
+                            continue
+                        eng, grade = cells[1], cells[-1]
+                        if grade not in ('O', 'X'):
+                            continue
+                        total[eng] = total.get(eng, 0) + 1
+                        if grade == 'X':
+                            wrong[eng] = wrong.get(eng, 0) + 1
+            except Exception as e:
+                logger.warning(f"결과 파일 읽기 실패 ({result_file}): {e}")
+        
+        return {eng: (wrong.get(eng, 0), count) for eng, count in total.items()}
+
+class AdaptiveTester:
+    """과거 결과의 문항 통계로 실력을 추정하며 다음 문제를 고르는 적응형 시험
+    
+    1모수 로지스틱(Rasch) 모형을 사용합니다. 단어의 난이도는 과거 오답률의
+    로짓이고, 실력(θ)은 격자 위 사후분포의 평균(EAP)으로 추정합니다.
+    현재 θ에서 정보량이 가장 큰 단어를 BATCH_SIZE개씩 묶어 출제하고,
+    사후 표준편차가 SE_TARGET 아래로 내려가거나, 남은 단어 중 가장 유익한 것의
+    정보량이 MIN_INFORMATION보다 작아지면(모두 맞히거나 모두 틀려서 추정값이
+    단어장 난이도 범위 밖으로 나간 경우) 시험을 마칩니다. 시험 중 확실하지 않은 답안은
+    record(None)으로 문항 수만 세므로, 종료 판단은 확실히 채점된 답안만으로 합니다.
+    """
+    
+    BATCH_SIZE = 5
+    MIN_ITEMS = 10
+    SE_TARGET = 0.4
+    MIN_INFORMATION = 0.1
+    GRID = [-4.0 + 0.1 * i for i in range(81)]
+    
+    def __init__(self, words: Sequence[WordPair], item_stats: Optional[Dict[str, Tuple[int, int]]] = None,
+                 seed: Optional[int] = None):
+        self.words = words
+        self.item_stats = item_stats or {}
+        self._rng = random.Random(seed)
+        self._remaining = list(range(len(words)))
+        self._asked = 0
+        # 표준정규 사전분포의 로그 밀도에서 시작합니다.
+        self._log_posterior = [-theta * theta / 2 for theta in self.GRID]
+    
+    def difficulty(self, word: WordPair) -> float:
+        """과거 오답률(0.5 보정)의 로짓을 난이도로 사용합니다. 처음 보는 단어는 0입니다."""
+        wrong, total = self.item_stats.get(word.eng, (0, 0))
+        p_wrong = (wrong + 0.5) / (total + 1.0)
+        return math.log(p_wrong / (1.0 - p_wrong))
+    
+    def estimate(self) -> Tuple[float, float]:
+        """현재 실력 추정값(θ)과 표준오차를 반환합니다."""
+        top = max(self._log_posterior)
+        weights = [math.exp(lp - top) for lp in self._log_posterior]
+        norm = sum(weights)
+        mean = sum(w * theta for w, theta in zip(weights, self.GRID)) / norm
+        var = sum(w * (theta - mean) ** 2 for w, theta in zip(weights, self.GRID)) / norm
+        return mean, math.sqrt(var)
+    
+    def is_finished(self) -> bool:
+        """모든 단어를 냈거나 추정값이 수렴했는지 확인합니다."""
+        if not self._remaining:
+            return True
+        if self._asked < self.MIN_ITEMS:
+            return False
+        theta, se = self.estimate()
+        if se < self.SE_TARGET:
+            return True
+        best = max(self._information(theta, index) for index in self._remaining)
+        return best < self.MIN_INFORMATION
+    
+    def next_batch(self) -> List[WordPair]:
+        """현재 θ에서 정보량이 큰 순서로 다음 묶음의 단어를 고릅니다."""
+        theta, _ = self.estimate()
+        
+        # 같은 정보량이면 무작위로 고르도록 먼저 섞습니다.
+        self._rng.shuffle(self._remaining)
+        self._remaining.sort(key=lambda index: self._information(theta, index), reverse=True)
+        batch, self._remaining = self._remaining[:self.BATCH_SIZE], self._remaining[self.BATCH_SIZE:]
+        return [self.words[index] for index in batch]
+    
+    def record(self, word: WordPair, correct: Optional[bool]):
+        """채점 결과를 반영합니다. 채점 불가(None)면 문항 수만 셉니다."""
+        self._asked += 1
+        if correct is None:
+            return
+        b = self.difficulty(word)
+        for i, theta in enumerate(self.GRID):
+            p = self._probability(theta, b)
+            self._log_posterior[i] += math.log(p if correct else 1.0 - p)
+    
+    def _information(self, theta: float, index: int) -> float:
+        """θ에서 index번째 단어의 피셔 정보량 p(1-p)를 계산합니다."""
+        p = self._probability(theta, self.difficulty(self.words[index]))
+        return p * (1.0 - p)
+    
+    @staticmethod
+    def _probability(theta: float, difficulty: float) -> float:
+        return 1.0 / (1.0 + math.exp(difficulty - theta))
+    
+    @staticmethod
+    def quick_grade(word: WordPair, answer: str) -> Optional[bool]:
+        """API 없이 확실히 판단되는 답안만 채점합니다 (빈칸/뜻 중 하나와 정확히 일치)."""
+        answer = answer.strip().lower()
+        if not answer:
+            return False
+        meanings = {word.kor.strip().lower()}
+        for part in word.kor.replace(';', ',').split(','):
+            meanings.add(part.strip().lower())
+        return True if answer in meanings else None
+
+class NonRetryableGradingError(Exception):
+    """다시 시도해도 성공할 수 없는 채점 오류 (잘못된 요청, 응답 잘림 등)"""
+
+class TransientGradingError(Exception):
+    """연결이 복구되면 성공할 수 있는 채점 오류 (채점 서버의 429, 5xx 등)"""
+
 class OpenAIService:
     """OpenAI API 서비스 클래스"""
     
-    def __init__(self):
+    # 한 번에 채점할 최대 단어 수와 gpt-4o-mini의 최대 출력 토큰 수
+    GRADING_CHUNK_SIZE = 100
+    MAX_OUTPUT_TOKENS = 16000
+    
+    def __init__(self, base_url: Optional[str] = None, max_retries: int = 2):
         self._client = None
+        # OpenAI 호환 서버(예: load_test.py의 모의 서버)를 쓰려면 base_url 또는 OPENAI_BASE_URL을 지정합니다.
+        self.base_url = base_url or os.getenv('OPENAI_BASE_URL') or None
+        self.max_retries = max_retries
+        # 채점 실패 시 작업을 보관할 오프라인 대기열 (설정된 경우에만 사용)
+        self.offline_queue: Optional["GradingQueue"] = None
     
     @property
     def client(self) -> OpenAI:
@@ -151,35 +459,113 @@ class OpenAIService:
             api_key = os.getenv('OPENAI_API_KEY')
             if not api_key:
                 raise ValueError("OpenAI API 키가 설정되지 않았습니다.")
-            self._client = OpenAI(api_key=api_key)
+            self._client = OpenAI(api_key=api_key, base_url=self.base_url,
+                                  max_retries=self.max_retries)
         return self._client
     
-    def grade_test(self, words: List[WordPair], user_answers: Dict[str, str]) -> str:
+    def is_configured(self) -> bool:
+        """자동 채점에 필요한 설정(API 키)이 있는지 확인합니다."""
+        api_key = os.getenv('OPENAI_API_KEY')
+        return bool(api_key and api_key.strip())
+    
+    def grade_test(self, words: Sequence[WordPair], user_answers: List[str]) -> str:
         """GPT를 사용하여 시험을 채점합니다."""
         # API 키 확인
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
+        if not self.is_configured():
             logger.warning("OpenAI API 키가 설정되지 않았습니다. 수동 채점용 결과를 생성합니다.")
             return self._create_manual_grading_result(words, user_answers)
         
         try:
-            prompt = self._create_grading_prompt(words, user_answers)
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                max_tokens=2000
-            )
-            return response.choices[0].message.content
+            return self.request_grading(words, user_answers)
         except Exception as e:
-            logger.error(f"GPT 채점 중 오류 발생: {e}")
-            return self._create_fallback_result(words, user_answers, str(e))
+            return self.handle_grading_failure(words, user_answers, e)
+    
+    def handle_grading_failure(self, words: Sequence[WordPair], user_answers: List[str], error: Exception,
+                               grades: Optional[List[str]] = None, summary: str = "") -> str:
+        """채점 실패 시 수동 채점용 결과를 만들고, 다시 시도할 만한 오류면 대기열에 넣습니다.
+        
+        grades를 주면 '-'인 문항만 나중에 다시 채점하고, 이미 채점된 결과와
+        표 아래의 summary는 결과 파일에 그대로 남깁니다.
+        """
+        logger.error(f"GPT 채점 중 오류 발생: {error}")
+        grades = list(grades) if grades is not None else ["-"] * len(words)
+        result = self.format_result_table(words, user_answers, grades) + summary
+        result += f"\n**오류 발생으로 인한 수동 채점 필요**\n오류 내용: {error}"
+        if self.offline_queue is not None and GradingQueue.is_retryable(error):
+            try:
+                result_path = self.offline_queue.enqueue(words, user_answers, result, str(error),
+                                                         grades, summary)
+                result += (f"\n\n**🔄 네트워크가 복구되면 백그라운드에서 자동으로 다시 채점합니다**\n"
+                           f"결과 파일: {result_path}")
+            except Exception as queue_error:
+                logger.error(f"채점 대기열 저장 실패: {queue_error}")
+        return result
+    
+    def request_grading(self, words: Sequence[WordPair], user_answers: List[str]) -> str:
+        """GPT에 채점을 요청합니다. 실패하면 예외를 그대로 전달합니다.
+        
+        단어가 많으면 GRADING_CHUNK_SIZE개씩 나눠 채점한 뒤 하나의 표로 합칩니다.
+        """
+        if len(words) <= self.GRADING_CHUNK_SIZE:
+            return self._request_grading_chunk(words, user_answers, 1)
+        
+        table = "| 번호 | 영어 | 정답 | 내 답 | 채점 |\n|---|---|---|---|---|\n"
+        for start in range(0, len(words), self.GRADING_CHUNK_SIZE):
+            end = start + self.GRADING_CHUNK_SIZE
+            result = self._request_grading_chunk(words[start:end], user_answers[start:end], start + 1)
+            for line in result.split('\n'):
+                cells = [c.strip() for c in line.strip().split('|')[1:-1]]
+                if len(cells) >= 2 and cells[0].isdigit():
+                    table += line.strip() + "\n"
+        return table
+    
+    def _request_grading_chunk(self, words: List[WordPair], user_answers: List[str], start: int) -> str:
+        """start번부터 번호를 매겨 단어 묶음 하나를 채점합니다."""
+        prompt = self._create_grading_prompt(words, user_answers, start)
+        response = self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,
+            max_tokens=self._max_tokens_for(words, user_answers)
+        )
+        choice = response.choices[0]
+        if choice.finish_reason == "length":
+            # 잘린 표로 채점하면 뒤쪽 문제가 채점 누락되고, 같은 요청은 다시 보내도 잘립니다.
+            raise NonRetryableGradingError("채점 응답이 max_tokens에서 잘렸습니다.")
+        return choice.message.content
+    
+    def _max_tokens_for(self, words: List[WordPair], user_answers: List[str]) -> int:
+        """채점 표 길이에 맞춰 max_tokens를 정합니다 (문자당 1토큰으로 넉넉하게 계산)."""
+        chars = sum(len(word.eng) + len(word.kor) + len(self._answer_at(user_answers, i)) + 20
+                    for i, word in enumerate(words))
+        return min(self.MAX_OUTPUT_TOKENS, 200 + chars)
     
-    def _create_grading_prompt(self, words: List[WordPair], user_answers: Dict[str, str]) -> str:
+    @staticmethod
+    def _answer_at(user_answers: List[str], index: int) -> str:
+        """문제 번호(0부터)에 해당하는 답안을 반환합니다."""
+        return user_answers[index] if index < len(user_answers) else ""
+    
+    @staticmethod
+    def parse_grades(result_md: str, count: int) -> List[str]:
+        """채점 결과 표에서 문제 번호별 채점 결과(O/X/?/-)를 추출합니다."""
+        grades = ["-"] * count
+        for line in result_md.split('\n'):
+            line = line.strip()
+            if not line.startswith('|'):
+                continue
+            cells = [c.strip() for c in line.split('|')[1:-1]]
+            if len(cells) < 2 or not cells[0].isdigit():
+                continue
+            index = int(cells[0]) - 1
+            if 0 <= index < count:
+                grades[index] = cells[-1]
+        return grades
+    
+    def _create_grading_prompt(self, words: List[WordPair], user_answers: List[str], start: int = 1) -> str:
         """채점용 프롬프트를 생성합니다."""
         table = "| 번호 | 영어 | 정답 | 내 답 |\n|---|---|---|---|\n"
-        for i, word in enumerate(words, 1):
-            ans = user_answers.get(word.eng, "")
+        for i, word in enumerate(words, start):
+            ans = self._answer_at(user_answers, i - start)
             table += f"| {i} | {word.eng} | {word.kor} | {ans} |\n"
         
         return f"""아래는 영어 단어 시험 결과입니다.
@@ -192,21 +578,21 @@ class OpenAIService:
 - 설명, 해설 등은 필요 없고, 채점된 표만 깔끔하게 마크다운으로 보내주세요.
 - 표 형식을 정확히 유지해주세요."""
     
-    def _create_fallback_result(self, words: List[WordPair], user_answers: Dict[str, str], error_msg: str) -> str:
-        """오류 시 대체 결과를 생성합니다."""
+    @classmethod
+    def format_result_table(cls, words: Sequence[WordPair], user_answers: List[str], grades: List[str]) -> str:
+        """문제 번호 순의 채점 결과(grades)로 결과 표를 생성합니다."""
         table = "| 번호 | 영어 | 정답 | 내 답 | 채점 |\n|---|---|---|---|---|\n"
         for i, word in enumerate(words, 1):
-            ans = user_answers.get(word.eng, "")
-            table += f"| {i} | {word.eng} | {word.kor} | {ans} | - |\n"
-        table += f"\n**오류 발생으로 인한 수동 채점 필요**\n오류 내용: {error_msg}"
+            ans = cls._answer_at(user_answers, i - 1)
+            table += f"| {i} | {word.eng} | {word.kor} | {ans} | {grades[i - 1]} |\n"
         return table
     
-    def _create_manual_grading_result(self, words: List[WordPair], user_answers: Dict[str, str]) -> str:
+    def _create_manual_grading_result(self, words: List[WordPair], user_answers: List[str]) -> str:
         """API 키가 없을 때 수동 채점용 결과를 생성합니다."""
         table = "| 번호 | 영어 | 정답 | 내 답 | 채점 |\n|---|---|---|---|---|\n"
         
         for i, word in enumerate(words, 1):
-            ans = user_answers.get(word.eng, "").strip()
+            ans = self._answer_at(user_answers, i - 1).strip()
             
             # 간단한 자동 채점 (정확히 일치하는 경우만)
             if ans.lower() == word.kor.lower():
@@ -226,18 +612,510 @@ class OpenAIService:
         
         return table
 
+class RemoteGradingService(OpenAIService):
+    """로컬 채점 서버(--serve)에 채점을 요청하는 서비스 클래스
+    
+    OpenAIService와 같은 인터페이스를 제공하므로 앱에서 그대로 교체해 쓸 수 있습니다.
+    서버에 연결할 수 없으면 OpenAIService와 마찬가지로 수동 채점용 결과를 돌려줍니다.
+    서버의 요청당 단어 수 제한에 맞춰 GRADING_CHUNK_SIZE개씩 나눠 보냅니다.
+    """
+    
+    TIMEOUT = 120
+    
+    def __init__(self, server_url: str, token: Optional[str] = None):
+        super().__init__()
+        self.server_url = server_url.rstrip('/')
+        # 채점 서버가 --token으로 실행된 경우 같은 토큰이 필요합니다.
+        self.token = token or os.getenv('WORD_TEST_SERVER_TOKEN') or None
+    
+    def is_configured(self) -> bool:
+        """API 키는 서버가 가지고 있으므로 항상 자동 채점을 시도합니다."""
+        return True
+    
+    def _request_grading_chunk(self, words: List[WordPair], user_answers: List[str], start: int) -> str:
+        """채점 서버의 /grade 엔드포인트를 호출하고 표 번호를 start부터 다시 매깁니다."""
+        payload = {
+            "words": [[word.eng, word.kor] for word in words],
+            "answers": list(user_answers),
+        }
+        result = self._post("/grade", payload)["result"]
+        if start == 1:
+            return result
+        lines = []
+        for line in result.split('\n'):
+            cells = line.split('|')
+            if len(cells) > 2 and cells[1].strip().isdigit():
+                cells[1] = f" {int(cells[1]) + start - 1} "
+                line = '|'.join(cells)
+            lines.append(line)
+        return '\n'.join(lines)
+    
+    def _post(self, path: str, payload: dict) -> dict:
+        """JSON 요청을 보내고 JSON 응답을 반환합니다."""
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        request = urllib.request.Request(
+            self.server_url + path,
+            data=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+            headers=headers,
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.TIMEOUT) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read().decode("utf-8")).get("error", str(e))
+            except Exception:
+                message = str(e)
+            error_cls = TransientGradingError
+            if 400 <= e.code < 500 and e.code not in (408, 429):
+                error_cls = NonRetryableGradingError
+            raise error_cls(f"채점 서버 오류 ({e.code}): {message}") from e
+
+class GradingServer:
+    """여러 클라이언트가 공유하는 asyncio 기반 로컬 채점 HTTP 서버
+    
+    모든 요청이 하나의 OpenAIService(하나의 연결 풀)를 공유하고,
+    요청 속도 제한, 결과 캐시, 동일한 진행 중 요청 병합을 서버 한 곳에서 처리합니다.
+    token을 지정하면 모든 요청에 "Authorization: Bearer <token>" 헤더가 필요합니다.
+    
+    엔드포인트:
+        GET  /health  서버 상태와 캐시 통계
+        POST /parse   {"content": 마크다운} -> {"words": [[영어, 뜻], ...]}
+        POST /grade   {"words": [[영어, 뜻], ...], "answers": [...]}
+                      -> {"result": 채점 표, "grades": [...]}
+    """
+    
+    MAX_CONCURRENCY = 8
+    REQUESTS_PER_MINUTE = 60
+    CACHE_SIZE = 1024
+    MAX_BODY_SIZE = 10 * 1024 * 1024
+    # /grade 요청 하나가 OpenAI 호출 하나를 넘지 않도록 채점 묶음 크기로 제한합니다.
+    MAX_WORDS_PER_REQUEST = OpenAIService.GRADING_CHUNK_SIZE
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765,
+                 service: Optional[OpenAIService] = None, token: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.service = service or OpenAIService()
+        self.token = token
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENCY)
+        self._cache: OrderedDict = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._next_slot = 0.0
+        self._rate_lock = None
+        self.stats = {"requests": 0, "cache_hits": 0, "coalesced": 0, "upstream_calls": 0}
+    
+    def run(self):
+        """서버를 실행합니다 (Ctrl+C로 종료)."""
+        try:
+            asyncio.run(self._serve())
+        except KeyboardInterrupt:
+            logger.info("채점 서버를 종료합니다.")
+        finally:
+            self._executor.shutdown(wait=False)
+    
+    async def _serve(self):
+        self._rate_lock = asyncio.Lock()
+        server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        logger.info(f"채점 서버 시작: http://{self.host}:{self.port}")
+        async with server:
+            await server.serve_forever()
+    
+    async def _handle_connection(self, reader, writer):
+        """HTTP 요청 하나를 읽어 처리하고 JSON으로 응답합니다."""
+        status, body = 500, {"error": "internal error"}
+        try:
+            method, path, headers, payload = await self._read_request(reader)
+            if self._is_authorized(headers):
+                status, body = await self._dispatch(method, path, payload)
+            else:
+                status, body = 401, {"error": "인증 토큰이 없거나 올바르지 않습니다."}
+        except ValueError as e:
+            status, body = 400, {"error": str(e)}
+        except Exception as e:
+            logger.error(f"채점 서버 요청 처리 중 오류: {e}")
+            # 다시 보내도 실패할 오류(응답 잘림, 잘못된 API 키 등)는 4xx로 알려서
+            # 클라이언트가 대기열에 넣고 재시도하지 않게 합니다.
+            status = 502 if GradingQueue.is_retryable(e) else 422
+            body = {"error": str(e)}
+        
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        reason = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found", 413: "Payload Too Large",
+                  422: "Unprocessable Entity", 502: "Bad Gateway"}.get(status, "Error")
+        header = (f"HTTP/1.1 {status} {reason}\r\n"
+                  f"Content-Type: application/json; charset=utf-8\r\n"
+                  f"Content-Length: {len(data)}\r\n"
+                  f"Connection: close\r\n\r\n")
+        try:
+            writer.write(header.encode("ascii") + data)
+            await writer.drain()
+        finally:
+            writer.close()
+    
+    async def _read_request(self, reader):
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        parts = request_line.split()
+        if len(parts) < 2:
+            raise ValueError("잘못된 요청입니다.")
+        method, path = parts[0].upper(), parts[1]
+        
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        if length > self.MAX_BODY_SIZE:
+            raise ValueError("요청 본문이 너무 큽니다.")
+        
+        payload = {}
+        if length:
+            payload = json.loads((await reader.readexactly(length)).decode("utf-8"))
+            if not isinstance(payload, dict):
+                raise ValueError("JSON 객체가 필요합니다.")
+        return method, path, headers, payload
+    
+    def _is_authorized(self, headers: Dict[str, str]) -> bool:
+        """토큰이 설정된 경우 Authorization 헤더를 상수 시간으로 비교합니다."""
+        if not self.token:
+            return True
+        expected = f"Bearer {self.token}".encode("utf-8")
+        return hmac.compare_digest(headers.get("authorization", "").encode("utf-8"), expected)
+    
+    async def _dispatch(self, method: str, path: str, payload: dict):
+        self.stats["requests"] += 1
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok", "cache_size": len(self._cache), **self.stats}
+        if method == "POST" and path == "/parse":
+            content = payload.get("content")
+            if not isinstance(content, str):
+                raise ValueError("content 필드가 필요합니다.")
+            words = MarkdownParser.parse_words_from_content(content)
+            return 200, {"words": [[word.eng, word.kor] for word in words]}
+        if method == "POST" and path == "/grade":
+            words, answers = self._parse_grade_payload(payload)
+            result = await self.grade(words, answers)
+            return 200, {"result": result,
+                         "grades": OpenAIService.parse_grades(result, len(words))}
+        return 404, {"error": f"{method} {path} 는 지원하지 않습니다."}
+    
+    @classmethod
+    def _parse_grade_payload(cls, payload: dict):
+        try:
+            words = [WordPair(str(eng), str(kor)) for eng, kor in payload["words"]]
+            answers = [str(ans) for ans in payload.get("answers", [])]
+        except (KeyError, TypeError, ValueError):
+            raise ValueError("words는 [영어, 뜻] 쌍의 목록이어야 합니다.")
+        if len(words) > cls.MAX_WORDS_PER_REQUEST:
+            raise ValueError(f"요청당 단어는 최대 {cls.MAX_WORDS_PER_REQUEST}개입니다.")
+        return words, answers
+    
+    async def grade(self, words: List[WordPair], user_answers: List[str]) -> str:
+        """캐시와 진행 중 요청 병합을 거쳐 채점 결과를 반환합니다."""
+        if not self.service.is_configured():
+            return self.service._create_manual_grading_result(words, user_answers)
+        
+        key = self._cache_key(words, user_answers)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return self._cache[key]
+        
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats["coalesced"] += 1
+        else:
+            task = asyncio.ensure_future(self._grade_upstream(key, words, user_answers))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # 한 클라이언트의 연결이 끊겨도 다른 대기자를 위해 작업은 계속합니다.
+        return await asyncio.shield(task)
+    
+    async def _grade_upstream(self, key: str, words: List[WordPair], user_answers: List[str]) -> str:
+        await self._wait_rate_limit()
+        self.stats["upstream_calls"] += 1
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self._executor, self.service.request_grading, words, user_answers)
+        
+        self._cache[key] = result
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+    
+    async def _wait_rate_limit(self):
+        """REQUESTS_PER_MINUTE를 넘지 않도록 호출 간격을 맞춥니다."""
+        interval = 60.0 / self.REQUESTS_PER_MINUTE
+        async with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    @staticmethod
+    def _cache_key(words: List[WordPair], user_answers: List[str]) -> str:
+        raw = json.dumps([[[w.eng, w.kor] for w in words], list(user_answers)],
+                         ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+class GradingQueue:
+    """실패한 채점 작업을 디스크에 보관했다가 백그라운드에서 다시 채점하는 대기열
+    
+    작업은 queue_dir에 JSON 파일 하나씩 원자적으로 저장되므로 프로그램을 종료해도
+    남아 있으며, 다음 실행 시 이어서 처리됩니다. 채점에 성공하면 results_dir의
+    세션 결과 파일을 같은 경로에 덮어써서 갱신합니다.
+    
+    연결 실패, 시간 초과, 429, 5xx 같은 일시적 오류는 시도 횟수에 세지 않고
+    BACKOFF_MAX 간격까지 늘려 가며 연결이 복구될 때까지 계속 재시도합니다.
+    다시 시도해도 소용없는 오류이거나 그 밖의 오류(잘못된 응답 등)로 MAX_ATTEMPTS번
+    실패한 작업은 queue_dir/dead 로 옮기고 더 이상 시도하지 않습니다.
+    """
+    
+    POLL_INTERVAL = 5.0
+    BACKOFF_BASE = 10.0
+    BACKOFF_MAX = 600.0
+    MAX_ATTEMPTS = 8
+    # 요청 자체가 잘못되어 다시 보내도 같은 결과가 나오는 HTTP 상태 코드
+    NON_RETRYABLE_STATUS = (400, 401, 403, 404, 422)
+    # 서버가 잠시 요청을 받지 못하는 상태 코드 (5xx도 포함)
+    TRANSIENT_STATUS = (408, 409, 429)
+    # 처리 중인 작업 파일의 접미사와, 이보다 오래된 선점은 비정상 종료로 보고 되돌리는 시간
+    CLAIM_SUFFIX = ".processing"
+    CLAIM_TIMEOUT = 3600.0
+    
+    def __init__(self, queue_dir: Path, results_dir: Path, service: OpenAIService):
+        self.queue_dir = Path(queue_dir)
+        self.dead_dir = self.queue_dir / "dead"
+        self.results_dir = Path(results_dir)
+        self.service = service
+        self.completed: queue.Queue = queue.Queue()  # 재채점 완료된 결과 파일 경로
+        self.dead_letters: queue.Queue = queue.Queue()  # 재채점을 포기한 결과 파일 경로
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @classmethod
+    def is_retryable(cls, error: Exception) -> bool:
+        """다시 시도하면 성공할 가능성이 있는 오류인지 확인합니다."""
+        if isinstance(error, NonRetryableGradingError):
+            return False
+        if isinstance(error, APIStatusError) and error.status_code in cls.NON_RETRYABLE_STATUS:
+            return False
+        return True
+    
+    @classmethod
+    def is_transient(cls, error: Exception) -> bool:
+        """네트워크/서버 상태 때문에 실패해 시도 횟수에 세지 않을 오류인지 확인합니다."""
+        if isinstance(error, (TransientGradingError, APIConnectionError, ConnectionError,
+                              TimeoutError, urllib.error.URLError)):
+            return True
+        if isinstance(error, APIStatusError):
+            return error.status_code in cls.TRANSIENT_STATUS or error.status_code >= 500
+        return False
+    
+    def enqueue(self, words: Sequence[WordPair], user_answers: List[str],
+                fallback_result: str, error_msg: str,
+                grades: Optional[List[str]] = None, summary: str = "") -> Path:
+        """작업을 저장하고, 임시 결과를 기록한 세션 결과 파일 경로를 반환합니다.
+        
+        grades에서 '-'인 문항만 다시 채점하며, summary는 갱신된 결과 표 아래에 그대로 붙입니다.
+        """
+        self.queue_dir.mkdir(parents=True, exist_ok=True)
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        
+        now = datetime.datetime.now()
+        job_id = f"{now.strftime('%y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        result_path = self.results_dir / f"result_{job_id}.md"
+        self._write_atomic(result_path,
+                           TestResult(words, user_answers, fallback_result, "").to_markdown(now))
+        
+        job = {
+            "id": job_id,
+            "created": now.isoformat(timespec="seconds"),
+            "words": [[word.eng, word.kor] for word in words],
+            "answers": list(user_answers),
+            "grades": list(grades) if grades is not None else ["-"] * len(words),
+            "summary": summary,
+            "result_path": str(result_path),
+            "attempts": 0,
+            "failures": 0,
+            "next_attempt": 0.0,
+            "last_error": error_msg,
+        }
+        self._save_job(job)
+        logger.info(f"채점 작업을 대기열에 저장했습니다: {job_id}")
+        return result_path
+    
+    def start(self):
+        """백그라운드 재채점 스레드를 시작합니다."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._worker, name="grading-queue", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """백그라운드 재채점 스레드를 멈춥니다."""
+        self._stop.set()
+    
+    def pending_count(self) -> int:
+        """대기 중인 작업 수를 반환합니다."""
+        if not self.queue_dir.is_dir():
+            return 0
+        return len(list(self.queue_dir.glob("*.json")))
+    
+    def process_due_jobs(self) -> int:
+        """재시도 시각이 된 작업들을 한 번씩 처리하고, 성공한 작업 수를 반환합니다."""
+        if not self.queue_dir.is_dir():
+            return 0
+        
+        self._release_stale_claims()
+        done = 0
+        for job_path in sorted(self.queue_dir.glob("*.json")):
+            if self._stop.is_set():
+                break
+            job = self._load_job(job_path)
+            if job is None or job.get("next_attempt", 0.0) > time.time():
+                continue
+            
+            # 같은 폴더를 쓰는 다른 실행 인스턴스와 겹치지 않도록 파일 이름을 바꿔 작업을 선점합니다.
+            claimed_path = job_path.with_name(job_path.name + self.CLAIM_SUFFIX)
+            try:
+                os.replace(job_path, claimed_path)
+            except FileNotFoundError:
+                continue  # 다른 인스턴스가 먼저 가져갔거나 이미 끝냈습니다.
+            os.utime(claimed_path)
+            # 읽은 뒤 선점하기 전에 다른 인스턴스가 갱신했을 수 있으므로 선점한 파일을 다시 읽습니다.
+            job = self._load_job(claimed_path)
+            if job is None:
+                continue
+            if job.get("next_attempt", 0.0) > time.time():
+                os.replace(claimed_path, job_path)
+                continue
+            try:
+                self._process_job(job, claimed_path)
+                done += 1
+            except Exception as e:
+                # 채점 호출뿐 아니라 결과 저장 실패도 같은 백오프를 따릅니다.
+                self._record_failure(job, claimed_path, e)
+        return done
+    
+    def _load_job(self, job_path: Path) -> Optional[dict]:
+        """작업 파일을 읽습니다. 없으면 None, 읽을 수 없으면 dead 폴더로 옮기고 None을 반환합니다."""
+        try:
+            with open(job_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"채점 작업 파일을 읽을 수 없습니다 ({job_path}): {e}")
+            self._move_to_dead(job_path)
+            return None
+    
+    def _release_stale_claims(self):
+        """처리 중에 프로그램이 종료되어 남은 선점 파일을 대기열로 되돌립니다."""
+        for claimed_path in self.queue_dir.glob("*.json" + self.CLAIM_SUFFIX):
+            try:
+                if time.time() - claimed_path.stat().st_mtime < self.CLAIM_TIMEOUT:
+                    continue
+                os.replace(claimed_path, claimed_path.with_name(claimed_path.name[:-len(self.CLAIM_SUFFIX)]))
+                logger.warning(f"오래된 선점 작업을 대기열로 되돌렸습니다: {claimed_path.name}")
+            except FileNotFoundError:
+                pass
+    
+    def _process_job(self, job: dict, job_path: Path):
+        """작업 하나를 채점하고 결과 파일을 갱신합니다. 실패하면 예외를 전달합니다."""
+        words = [WordPair(eng, kor) for eng, kor in job["words"]]
+        answers = job["answers"]
+        grades = list(job.get("grades") or ["-"] * len(words))
+        pending = [i for i, grade in enumerate(grades) if grade == "-"]
+        if pending:
+            result = self.service.request_grading([words[i] for i in pending], [answers[i] for i in pending])
+            if not result:
+                raise ValueError("채점 응답이 비어 있습니다.")
+            for i, grade in zip(pending, OpenAIService.parse_grades(result, len(pending))):
+                grades[i] = grade
+        
+        created = datetime.datetime.fromisoformat(job["created"])
+        result = OpenAIService.format_result_table(words, answers, grades) + job.get("summary", "")
+        document = TestResult(words, answers, result, "").to_markdown(created)
+        self._write_atomic(Path(job["result_path"]), document)
+        job_path.unlink(missing_ok=True)
+        self.completed.put(job["result_path"])
+        logger.info(f"백그라운드 재채점 완료: {job['result_path']}")
+    
+    def _record_failure(self, job: dict, job_path: Path, error: Exception):
+        """실패 횟수를 기록하고 다음 시도 시각을 정하거나, 더 시도하지 않을 작업을 옮깁니다."""
+        # 일시적 오류는 시도 횟수를 쓰지 않고 백오프 간격만 늘립니다.
+        if not self.is_transient(error):
+            job["attempts"] = job.get("attempts", 0) + 1
+        job["failures"] = job.get("failures", 0) + 1
+        job["last_error"] = str(error)
+        
+        if not self.is_retryable(error) or job.get("attempts", 0) >= self.MAX_ATTEMPTS:
+            job["next_attempt"] = None
+            self.dead_dir.mkdir(parents=True, exist_ok=True)
+            self._save_job(job, self.dead_dir)
+            job_path.unlink(missing_ok=True)
+            self.dead_letters.put(job.get("result_path", ""))
+            logger.error(f"재채점 포기 ({job['id']}, {job['failures']}회): {error}")
+            return
+        
+        delay = min(self.BACKOFF_BASE * (2 ** min(job["failures"] - 1, 16)), self.BACKOFF_MAX)
+        job["next_attempt"] = time.time() + delay * random.uniform(0.8, 1.2)
+        self._save_job(job)
+        job_path.unlink(missing_ok=True)
+        logger.warning(f"재채점 실패 ({job['id']}, {job['failures']}회): {error} - {delay:.0f}초 후 재시도")
+    
+    def _move_to_dead(self, job_path: Path):
+        """작업 파일을 dead 폴더로 옮겨 더 이상 처리하지 않게 합니다."""
+        try:
+            self.dead_dir.mkdir(parents=True, exist_ok=True)
+            os.replace(job_path, self.dead_dir / job_path.name)
+        except Exception as e:
+            logger.error(f"작업 파일을 dead 폴더로 옮기지 못했습니다 ({job_path}): {e}")
+    
+    def _worker(self):
+        while not self._stop.is_set():
+            try:
+                self.process_due_jobs()
+            except Exception as e:
+                logger.error(f"채점 대기열 처리 중 오류: {e}")
+            self._stop.wait(self.POLL_INTERVAL)
+    
+    def _save_job(self, job: dict, directory: Optional[Path] = None):
+        self._write_atomic((directory or self.queue_dir) / f"{job['id']}.json",
+                           json.dumps(job, ensure_ascii=False, indent=2))
+    
+    @staticmethod
+    def _write_atomic(path: Path, text: str):
+        """임시 파일에 쓴 뒤 교체하여 중간에 종료되어도 파일이 깨지지 않게 합니다."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
 class WordTestWindow:
     """단어 시험 창 클래스"""
     
-    def __init__(self, words: List[WordPair]):
+    def __init__(self, words: Sequence[WordPair], title: Optional[str] = None, first_number: int = 1):
         self.words = words
-        self.answers = {}
+        self.answers: List[str] = []
         self.submitted = False
         self.entries = []
+        self.title = title or f"영어 단어 시험 ({len(words)}문제)"
+        self.first_number = first_number
         
         # 창 생성
         self.root = tk.Toplevel()
-        self.root.title(f"영어 단어 시험 ({len(words)}문제)")
+        self.root.title(self.title)
         self.root.geometry("600x700")
         self.root.configure(bg="#ffffff")
         
@@ -258,7 +1136,7 @@ class WordTestWindow:
         main_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
         # 제목
-        title_label = tk.Label(main_frame, text=f"영어 단어 시험 ({len(self.words)}문제)", 
+        title_label = tk.Label(main_frame, text=self.title, 
                               font=("Arial", 16, "bold"), bg="#ffffff", fg="#333333")
         title_label.pack(pady=(0, 20))
         
@@ -287,7 +1165,7 @@ class WordTestWindow:
         # 단어 입력 필드들
         for i, word in enumerate(self.words):
             # 문제 번호와 영어 단어
-            label = tk.Label(scrollable_frame, text=f"{i+1}. {word.eng}", 
+            label = tk.Label(scrollable_frame, text=f"{i + self.first_number}. {word.eng}", 
                            font=("Arial", 12), bg="#ffffff", fg="#333333", anchor="w")
             label.grid(row=i, column=0, padx=10, pady=5, sticky="w")
             
@@ -350,11 +1228,11 @@ class WordTestWindow:
     def submit_test(self):
         """시험을 제출합니다."""
         try:
-            # 답안 수집
-            for i, word in enumerate(self.words):
-                if i < len(self.entries):
-                    answer = self.entries[i].get().strip()
-                    self.answers[word.eng] = answer
+            # 답안 수집 (문제 번호 순서대로 저장하므로 중복 단어도 각각 유지됨)
+            self.answers = [
+                self.entries[i].get().strip() if i < len(self.entries) else ""
+                for i in range(len(self.words))
+            ]
             
             logger.info(f"총 {len(self.answers)}개의 답안 수집 완료")
             self.submitted = True
@@ -366,8 +1244,8 @@ class WordTestWindow:
             logger.error(f"submit_test 중 오류: {e}")
             self.submitted = False
     
-    def run(self) -> Optional[Dict[str, str]]:
-        """시험을 실행하고 결과를 반환합니다."""
+    def run(self) -> Optional[List[str]]:
+        """시험을 실행하고 문제 순서대로 답안 목록을 반환합니다."""
         try:
             self.root.mainloop()
         except Exception as e:
@@ -375,7 +1253,7 @@ class WordTestWindow:
             self.submitted = False
         
         if self.submitted and self.answers:
-            return dict(self.answers)
+            return list(self.answers)
         else:
             return None
 
@@ -440,8 +1318,10 @@ class ResultWindow:
         """결과를 표시합니다."""
         header, data = self._parse_md_table(self.test_result.gpt_result)
         
-        # 점수 요약
-        score_info = self._calculate_score_info(data)
+        # 점수 요약 (문제 번호별 채점 결과 사용)
+        grades = self.test_result.grades or OpenAIService.parse_grades(
+            self.test_result.gpt_result, len(self.test_result.words))
+        score_info = self._calculate_score_info(grades)
         score_frame = tk.Frame(parent, bg="#f8f9fa", relief="solid", borderwidth=1)
         score_frame.pack(fill="x", pady=(0, 20))
         
@@ -529,23 +1409,13 @@ class ResultWindow:
         
         return header, data
     
-    def _calculate_score_info(self, data):
-        """점수 정보를 계산합니다."""
-        correct = 0
-        incorrect = 0
-        manual = 0
-        
-        for row in data:
-            if row and len(row) > 0:
-                grade = row[-1].strip()
-                if grade == 'O':
-                    correct += 1
-                elif grade == 'X':
-                    incorrect += 1
-                elif grade == '?':
-                    manual += 1
-        
-        total = len(data)
+    def _calculate_score_info(self, grades: List[str]):
+        """문제 번호별 채점 결과로 점수 정보를 계산합니다."""
+        correct = grades.count('O')
+        incorrect = grades.count('X')
+        manual = grades.count('?')
+        
+        total = len(grades)
         auto_total = correct + incorrect
         percentage = (correct / auto_total * 100) if auto_total > 0 else 0
         
@@ -576,19 +1446,15 @@ class ResultWindow:
                     ("Text files", "*.txt"),
                     ("All files", "*.*")
                 ],
-                initialfile=default_filename
+                initialfile=default_filename,
+                initialdir=str(RESULTS_DIR) if RESULTS_DIR.is_dir() else None
             )
             
             if not filepath:
                 return
             
-            # 결과에 헤더 추가
-            header = f"# 영어 단어 시험 결과\n\n"
-            header += f"시험 일시: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            header += f"총 문제 수: {len(self.test_result.words)}문제\n\n"
-            
             with open(filepath, "w", encoding="utf-8") as f:
-                f.write(header + self.test_result.gpt_result)
+                f.write(self.test_result.to_markdown(now))
             
             messagebox.showinfo("저장 완료", f"결과가 저장되었습니다:\n{filepath}")
             logger.info(f"결과가 {filepath}에 저장되었습니다.")
@@ -600,14 +1466,8 @@ class ResultWindow:
     def copy_result(self):
         """결과를 클립보드에 복사합니다."""
         try:
-            # 헤더 생성
-            now = datetime.datetime.now()
-            header = f"# 영어 단어 시험 결과\n\n"
-            header += f"시험 일시: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            header += f"총 문제 수: {len(self.test_result.words)}문제\n\n"
-            
             # 전체 결과 텍스트
-            full_result = header + self.test_result.gpt_result
+            full_result = self.test_result.to_markdown()
             
             # 클립보드에 복사
             self.root.clipboard_clear()
@@ -643,10 +1503,125 @@ class ResultWindow:
             logger.error(f"결과 창 실행 중 오류: {e}")
             self._on_close()
 
+class PhaseProfiler:
+    """주요 단계별 CPU/메모리 사용량을 측정하는 프로파일러
+    
+    --profile 옵션을 줬을 때만 install()이 대상 메서드를 감싸므로,
+    옵션이 없으면 실행 경로에 아무 비용도 추가되지 않습니다.
+    """
+    
+    # (클래스, 메서드 이름) 목록
+    PHASES = [
+        (MarkdownParser, 'parse_words_from_file'),
+        (WordSampler, 'sample'),
+        (WordTestWindow, 'setup_ui'),
+        (OpenAIService, 'grade_test'),
+        # 적응형 시험, 재채점 대기열, 채점 서버는 grade_test를 거치지 않고 직접 호출합니다.
+        (OpenAIService, 'request_grading'),
+        (ResultWindow, '_display_results'),
+    ]
+    TOP_FUNCTIONS = 30
+    TOP_ALLOCATIONS = 20
+    
+    def __init__(self, profile_dir: Path):
+        self.profile_dir = Path(profile_dir)
+        # 측정 중인 단계가 있으면 잠겨 있습니다. 중첩 호출과 다른 스레드(채점 서버,
+        # 재채점 대기열)의 동시 호출은 측정하지 않고 그대로 실행합니다.
+        self._lock = threading.Lock()
+        self._count = 0
+        self._session = datetime.datetime.now().strftime('%y%m%d_%H%M%S')
+    
+    def install(self):
+        """대상 메서드들을 프로파일링 래퍼로 교체합니다."""
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        for owner, name in self.PHASES:
+            raw = owner.__dict__[name]
+            phase = f"{owner.__name__}.{name}"
+            if isinstance(raw, classmethod):
+                setattr(owner, name, classmethod(self._wrap(raw.__func__, phase)))
+            elif isinstance(raw, staticmethod):
+                setattr(owner, name, staticmethod(self._wrap(raw.__func__, phase)))
+            else:
+                setattr(owner, name, self._wrap(raw, phase))
+        logger.info(f"프로파일링 모드 활성화: {self.profile_dir}")
+    
+    def _wrap(self, func, phase: str):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # 단계가 중첩되면 바깥 단계에서만 측정합니다 (cProfile/tracemalloc은 중첩 불가).
+            if not self._lock.acquire(blocking=False):
+                return func(*args, **kwargs)
+            try:
+                return self._run(phase, func, args, kwargs)
+            finally:
+                self._lock.release()
+        return wrapper
+    
+    def _run(self, phase: str, func, args, kwargs):
+        import cProfile
+        import tracemalloc
+        
+        profiler = cProfile.Profile()
+        tracemalloc.start()
+        start = datetime.datetime.now()
+        profiler.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            elapsed = (datetime.datetime.now() - start).total_seconds()
+            self._write_report(phase, profiler, snapshot, current, peak, elapsed)
+    
+    def _write_report(self, phase: str, profiler, snapshot, current: int, peak: int, elapsed: float):
+        """단계별 보고서를 profile_dir에 저장합니다."""
+        import io
+        import pstats
+        import tracemalloc
+        
+        self._count += 1
+        report_path = self.profile_dir / f"{self._session}_{self._count:03d}_{phase}.txt"
+        try:
+            stats_stream = io.StringIO()
+            stats = pstats.Stats(profiler, stream=stats_stream)
+            stats.sort_stats('cumulative').print_stats(self.TOP_FUNCTIONS)
+            
+            snapshot = snapshot.filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ])
+            
+            with open(report_path, "w", encoding="utf-8") as f:
+                f.write(f"# {phase}\n\n")
+                f.write(f"소요 시간: {elapsed:.3f}초\n")
+                f.write(f"최대 메모리: {peak / 1024:.1f} KiB\n")
+                f.write(f"종료 시 메모리: {current / 1024:.1f} KiB\n\n")
+                f.write(f"## 할당 위치 상위 {self.TOP_ALLOCATIONS}개\n\n")
+                for stat in snapshot.statistics('lineno')[:self.TOP_ALLOCATIONS]:
+                    f.write(f"{stat}\n")
+                f.write(f"\n## 함수 상위 {self.TOP_FUNCTIONS}개 (누적 시간 순)\n\n")
+                f.write(stats_stream.getvalue())
+            
+            logger.info(f"프로파일 보고서 저장: {report_path} ({elapsed:.3f}초, 최대 {peak / 1024:.1f} KiB)")
+        except Exception as e:
+            logger.error(f"프로파일 보고서 저장 실패 ({phase}): {e}")
+
 class MainApplication:
     """메인 애플리케이션 클래스"""
     
-    def __init__(self):
+    QUEUE_POLL_MS = 2000
+    
+    def __init__(self, sample_size: Optional[int] = None, seed: Optional[int] = None,
+                 weighted: bool = False, server_url: Optional[str] = None,
+                 server_token: Optional[str] = None, adaptive: bool = False):
+        # 샘플링 모드 설정 (sample_size가 없으면 전체 단어 시험)
+        self.sample_size = sample_size
+        self.seed = seed
+        self.weighted = weighted
+        self.adaptive = adaptive
+        
         # tkinterdnd2 사용 가능 여부 확인
         self.dnd_available = False
         try:
@@ -663,12 +1638,24 @@ class MainApplication:
         self.root.geometry("500x300")
         self.root.configure(bg="#ffffff")
         
-        self.openai_service = OpenAIService()
+        if server_url:
+            self.openai_service = RemoteGradingService(server_url, server_token)
+            logger.info(f"채점 서버 사용: {server_url}")
+        else:
+            self.openai_service = OpenAIService()
+        
+        # 실패한 채점을 보관했다가 다시 채점하는 대기열
+        self.grading_queue = GradingQueue(QUEUE_DIR, RESULTS_DIR, self.openai_service)
+        self.openai_service.offline_queue = self.grading_queue
+        self.grading_queue.start()
+        
         self.setup_ui()
         
         # 드래그 앤 드롭 설정
         if self.dnd_available:
             self._setup_drag_drop()
+        
+        self.root.after(self.QUEUE_POLL_MS, self._poll_grading_queue)
     
     def setup_ui(self):
         """메인 UI를 구성합니다."""
@@ -704,11 +1691,31 @@ class MainApplication:
         api_status = self._check_api_key()
         status_color = "#28a745" if api_status else "#dc3545"
         status_text = "✅ API 키 설정됨" if api_status else "❌ API 키 없음 (.env 파일에 설정 필요)"
+        if isinstance(self.openai_service, RemoteGradingService):
+            status_color = "#28a745"
+            status_text = f"✅ 채점 서버: {self.openai_service.server_url}"
         
         status_label = tk.Label(main_frame, text=status_text, 
                                font=("Arial", 10), bg="#ffffff", fg=status_color)
         status_label.pack(pady=(20, 0))
     
+    def _poll_grading_queue(self):
+        """백그라운드 재채점이 끝난 결과를 사용자에게 알립니다."""
+        try:
+            while True:
+                result_path = self.grading_queue.completed.get_nowait()
+                messagebox.showinfo("채점 완료", f"대기 중이던 시험의 채점이 완료되었습니다:\n{result_path}")
+        except queue.Empty:
+            pass
+        try:
+            while True:
+                result_path = self.grading_queue.dead_letters.get_nowait()
+                messagebox.showwarning("자동 채점 실패",
+                                       f"다시 시도해도 채점할 수 없어 수동 채점이 필요합니다:\n{result_path}")
+        except queue.Empty:
+            pass
+        self.root.after(self.QUEUE_POLL_MS, self._poll_grading_queue)
+    
     def _check_api_key(self) -> bool:
         """API 키 설정 여부를 확인합니다."""
         api_key = os.getenv('OPENAI_API_KEY')
@@ -751,36 +1758,42 @@ class MainApplication:
         logger.info(f"시험 시작: {file_path}")
         
         try:
-            # 1. 단어 추출
-            words = MarkdownParser.parse_words_from_file(file_path)
+            # 1. 단어 추출 및 섞기
+            words = self._load_test_words(file_path)
             if not words:
                 messagebox.showerror("오류", "파일에서 단어를 추출할 수 없습니다.")
                 return
             
             logger.info(f"단어 추출 완료: {len(words)}개")
             
-            # 2. 단어 섞기
-            random.shuffle(words)
-            
-            # 3. 시험 실행
-            test_window = WordTestWindow(words)
-            user_answers = test_window.run()
-            
-            if user_answers is None:
-                logger.info("사용자가 시험을 취소했습니다.")
-                return
-            
-            logger.info(f"답안 개수: {len(user_answers)}")
-            
-            # 채점 진행 알림
-            messagebox.showinfo("채점 중", "답안을 채점하고 있습니다. 잠시만 기다려주세요...")
-            
-            # 4. GPT 채점
-            gpt_result = self.openai_service.grade_test(words, user_answers)
+            if self.adaptive:
+                # 2~3. 적응형 시험 (묶음 단위로 출제/채점)
+                adaptive_result = self._run_adaptive_test(words)
+                if adaptive_result is None:
+                    logger.info("사용자가 시험을 취소했습니다.")
+                    return
+                words, user_answers, grades, gpt_result = adaptive_result
+            else:
+                # 2. 시험 실행
+                test_window = WordTestWindow(words)
+                user_answers = test_window.run()
+                
+                if user_answers is None:
+                    logger.info("사용자가 시험을 취소했습니다.")
+                    return
+                
+                logger.info(f"답안 개수: {len(user_answers)}")
+                
+                # 채점 진행 알림
+                messagebox.showinfo("채점 중", "답안을 채점하고 있습니다. 잠시만 기다려주세요...")
+                
+                # 3. GPT 채점
+                gpt_result = self.openai_service.grade_test(words, user_answers)
+                grades = OpenAIService.parse_grades(gpt_result, len(words))
             
-            # 5. 결과 표시
+            # 4. 결과 표시
             date_str = os.path.splitext(os.path.basename(file_path))[0]
-            test_result = TestResult(words, user_answers, gpt_result, date_str)
+            test_result = TestResult(words, user_answers, gpt_result, date_str, grades)
             
             result_window = ResultWindow(test_result)
             result_window.run()
@@ -793,6 +1806,79 @@ class MainApplication:
             logger.error(error_msg)
             messagebox.showerror("오류", error_msg)
     
+    def _run_adaptive_test(self, pool: Sequence[WordPair]):
+        """적응형 시험을 진행하고 (출제 단어, 답안, 채점 결과, 결과 표)를 반환합니다.
+        
+        시험 중에는 확실히 판단되는 답안(빈칸/뜻과 정확히 일치)만 추정에 반영하고,
+        나머지는 문항 수만 센 뒤 시험이 끝나면 한 번의 GPT 호출로 모아서 채점합니다.
+        """
+        item_stats = WordSampler.load_item_stats(RESULTS_DIR)
+        tester = AdaptiveTester(pool, item_stats, seed=self.seed)
+        words: List[WordPair] = []
+        answers: List[str] = []
+        
+        while not tester.is_finished():
+            batch = tester.next_batch()
+            title = f"적응형 시험 ({len(words) + 1}~{len(words) + len(batch)}번 / 최대 {len(pool)}문제)"
+            batch_answers = WordTestWindow(batch, title=title, first_number=len(words) + 1).run()
+            if batch_answers is None:
+                return None
+            
+            for word, answer in zip(batch, batch_answers):
+                # 확실하지 않은 답안(None)은 추측으로 θ를 움직이지 않도록 문항 수만 셉니다.
+                tester.record(word, AdaptiveTester.quick_grade(word, answer))
+            words.extend(batch)
+            answers.extend(batch_answers)
+            theta, se = tester.estimate()
+            logger.info(f"적응형 시험 진행: {len(words)}문제, θ={theta:.2f}±{se:.2f}")
+        
+        # 확실한 답안은 바로 채점하고, 나머지만 모아 한 번에 채점합니다.
+        quick = [AdaptiveTester.quick_grade(word, answer) for word, answer in zip(words, answers)]
+        grades = ["" if q is None else ("O" if q else "X") for q in quick]
+        pending = [i for i, q in enumerate(quick) if q is None]
+        error = None
+        if pending and not self.openai_service.is_configured():
+            for i in pending:
+                grades[i] = "?"  # 수동 확인 필요
+        elif pending:
+            messagebox.showinfo("채점 중", "답안을 채점하고 있습니다. 잠시만 기다려주세요...")
+            try:
+                result = self.openai_service.request_grading(
+                    [words[i] for i in pending], [answers[i] for i in pending])
+                for i, grade in zip(pending, OpenAIService.parse_grades(result, len(pending))):
+                    grades[i] = grade
+            except Exception as e:
+                error = e
+                for i in pending:
+                    grades[i] = "-"
+        
+        # 최종 채점 결과로 실력을 다시 추정합니다.
+        final = AdaptiveTester(pool, item_stats)
+        for word, grade in zip(words, grades):
+            final.record(word, {"O": True, "X": False}.get(grade))
+        theta, se = final.estimate()
+        
+        summary = (f"\n**🎯 적응형 시험**: 전체 {len(pool)}문제 중 {len(words)}문제 출제\n"
+                   f"추정 실력(θ): {theta:.2f} (표준오차 {se:.2f})\n")
+        if error is not None:
+            # 채점되지 않은 문항만 대기열에 넣고, 위 추정 결과는 결과 파일에 그대로 둡니다.
+            summary += "채점되지 않은(-) 문항은 추정에서 제외했습니다.\n"
+            result = self.openai_service.handle_grading_failure(words, answers, error, grades, summary)
+        else:
+            result = OpenAIService.format_result_table(words, answers, grades) + summary
+        return words, answers, grades, result
+    
+    def _load_test_words(self, file_path: str) -> Sequence[WordPair]:
+        """시험에 사용할 단어를 섞인 순서로 가져옵니다."""
+        if not self.sample_size:
+            words = MarkdownParser.parse_words_from_file(file_path)
+            words.shuffle(random.Random(self.seed))
+            return words
+        
+        error_rates = WordSampler.load_error_rates(RESULTS_DIR) if self.weighted else None
+        sampler = WordSampler(self.sample_size, seed=self.seed, error_rates=error_rates)
+        return sampler.sample([file_path])
+    
     def run(self):
         """애플리케이션을 실행합니다."""
         try:
@@ -800,11 +1886,77 @@ class MainApplication:
         except Exception as e:
             logger.error(f"프로그램 실행 중 오류: {e}")
             messagebox.showerror("치명적 오류", f"프로그램 실행 중 치명적 오류가 발생했습니다:\n{e}")
+        finally:
+            self.grading_queue.stop()
+
+def _positive_int(value: str) -> int:
+    """1 이상의 정수만 허용하는 argparse 타입입니다."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"정수가 아닙니다: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"1 이상이어야 합니다: {value}")
+    return number
+
+def _host_port(value: str) -> Tuple[str, int]:
+    """'HOST:PORT' 또는 'PORT' 형식을 (호스트, 포트)로 변환하는 argparse 타입입니다."""
+    host, _, port = value.rpartition(":")
+    try:
+        number = int(port)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"HOST:PORT 형식이어야 합니다: {value}")
+    if not 0 < number < 65536:
+        raise argparse.ArgumentTypeError(f"포트 번호가 올바르지 않습니다: {port}")
+    return host or "127.0.0.1", number
+
+def _is_loopback(host: str) -> bool:
+    """이 컴퓨터에서만 접속할 수 있는 주소인지 확인합니다."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="영어 단어 시험 프로그램")
+    parser.add_argument("--sample", type=_positive_int, metavar="N",
+                        help="단어장 전체 대신 N개 단어만 무작위로 뽑아 시험합니다")
+    parser.add_argument("--seed", type=int,
+                        help="같은 값을 주면 같은 순서/같은 단어로 시험이 재현됩니다")
+    parser.add_argument("--weighted", action="store_true",
+                        help="--sample 사용 시 results/ 의 과거 오답률이 높은 단어를 더 자주 뽑습니다")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="results/ 의 과거 결과로 실력을 추정하며 필요한 만큼만 출제하는 적응형 시험")
+    parser.add_argument("--server", default=os.getenv('WORD_TEST_SERVER'), metavar="URL",
+                        help="OpenAI를 직접 호출하지 않고 채점 서버(--serve)를 사용합니다 (예: http://192.168.0.10:8765)")
+    parser.add_argument("--serve", nargs="?", const=("127.0.0.1", 8765), type=_host_port, metavar="HOST:PORT",
+                        help="GUI 대신 여러 클라이언트가 공유하는 채점 서버를 실행합니다 (기본: 127.0.0.1:8765)")
+    parser.add_argument("--token", default=os.getenv('WORD_TEST_SERVER_TOKEN'), metavar="TOKEN",
+                        help="채점 서버 공유 토큰 (--serve는 이 토큰이 없는 요청을 거부하고, --server는 요청에 포함합니다)")
+    parser.add_argument("--profile", nargs="?", const=str(SCRIPT_DIR / 'profile'), metavar="DIR",
+                        help="주요 단계별 CPU/메모리 프로파일 보고서를 DIR(기본: profile/)에 저장합니다")
+    args = parser.parse_args(argv)
+    if args.serve and not args.token and not _is_loopback(args.serve[0]):
+        # 인증 없이 외부에 열면 누구나 서버의 OpenAI 키로 채점을 요청할 수 있습니다.
+        parser.error("루프백이 아닌 주소로 --serve 하려면 --token(또는 WORD_TEST_SERVER_TOKEN)이 필요합니다")
+    return args
 
 def main():
     """메인 함수"""
+    args = parse_args()
+    setup_app_environment()
+    if args.profile:
+        PhaseProfiler(Path(args.profile)).install()
+    if args.serve:
+        host, port = args.serve
+        GradingServer(host, port, token=args.token).run()
+        return
     try:
-        app = MainApplication()
+        app = MainApplication(sample_size=args.sample, seed=args.seed, weighted=args.weighted,
+                              server_url=args.server, server_token=args.token, adaptive=args.adaptive)
         app.run()
     except Exception as e:
         logger.error(f"애플리케이션 시작 실패: {e}")